@@ -1,108 +1,359 @@
 import pandas as pd
+import numpy as np
 import json
 import os
+import sys
+import zipfile
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+
+# pyarrow is optional - if its there the csv gets parsed on all cores
+try:
+    import pyarrow
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+# same idea for orjson, way faster than the json module on big files
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# dtype hints for the plain C parser so it doesnt have to guess types
+SALES_DTYPES = {"Product": "category", "Region": "category", "Revenue": "float64"}
+# only these fields are used later on, everything else is skipped at read time
+SALES_COLUMNS = ["Product", "Region", "Revenue"]
+PRODUCT_COLUMNS = ["Product", "Category"]
+# the region sheet is read whole - its extra columns ( Manager etc ) are what show regions missing from the sheet after merging
 
 # TODO: try to make add some visualizations and powerful insights ( REMEMBER to copy this code )
 
-print("Starting my data pipeline project...")
-print("Checking for requirements to run the code...!")
+# loaders run on threads, one write per line keeps their messages from mixing
+def say(msg):
+    sys.stdout.write(msg + "\n")
+
+# Parquet cache for the loaded frames, keyed on file name + columns and thrown away when the source changes
+CACHE_DIR = ".cache"
+
+def cache_path(filename, columns=None):
+    name = os.path.basename(filename)
+    if columns is not None:
+        name += "." + "_".join(columns)
+    return os.path.join(CACHE_DIR, name + ".parquet")
+
+def read_cache(filename, columns=None):
+    src_mtime = os.path.getmtime(filename)  # a missing source file raises FileNotFoundError for the loader
+    cache = cache_path(filename, columns)
+    if HAVE_PYARROW and os.path.exists(cache) and os.path.getmtime(cache) >= src_mtime:
+        try:
+            return pd.read_parquet(cache)
+        except (pyarrow.ArrowException, ValueError, OSError) as e:
+            # broken cache file, parse the source again and the loader writes a fresh one
+            say(f"Ignoring broken cache for {filename}: {e}")
+    return None
+
+def write_cache(filename, columns, df):
+    if not HAVE_PYARROW:
+        return
+    cache = cache_path(filename, columns)
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # write next to it and swap it in, an interrupted run never leaves half a cache file behind
+        df.to_parquet(tmp, compression="zstd", index=False)
+        os.replace(tmp, cache)
+    except (pyarrow.ArrowException, ValueError, TypeError, OSError) as e:
+        say(f"Couldn't cache {filename}: {e}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
 # CSV Region
-def load_csv_file(filename):
+def load_csv_file(filename, usecols=None):
     # make sure csv file path is perfectly added
-    if not os.path.exists(filename):
-        print(f"Uh oh, can't find {filename}")
-        return None
     try:
-        df = pd.read_csv(filename)
-        print(f"Got {len(df)} rows from {filename}")
+        df = read_cache(filename, usecols)
+        if df is None:
+            if HAVE_PYARROW:
+                df = pd.read_csv(filename, usecols=usecols, engine="pyarrow")
+            else:
+                df = pd.read_csv(filename, usecols=usecols, dtype=SALES_DTYPES, low_memory=False)
+            write_cache(filename, usecols, df)
+        say(f"Got {len(df)} rows from {filename}")
         return df
-    except:
-        print(f"Something went wrong loading {filename}")
+    except FileNotFoundError:
+        say(f"Uh oh, can't find {filename}")
+        return None
+    except (pd.errors.ParserError, ValueError, KeyError) as e:
+        say(f"Something went wrong loading {filename}: {e}")
         return None
 # JSON Region
 def load_json_stuff(filename):
     # json file is added here to the code 
-    if not os.path.exists(filename):
-        print(f"Missing file: {filename}")
-        return None    
     try:
-        with open(filename) as f:
-            data = json.load(f)
-        df = pd.DataFrame(data)
-        print(f"JSON loaded - got {len(df)} products")
+        df = read_cache(filename, PRODUCT_COLUMNS)
+        if df is None:
+            if HAVE_ORJSON:
+                with open(filename, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filename) as f:
+                    data = json.load(f)
+            df = pd.DataFrame.from_records(data, columns=PRODUCT_COLUMNS)
+            df["Product"] = df["Product"].astype("category")
+            write_cache(filename, PRODUCT_COLUMNS, df)
+        say(f"JSON loaded - got {len(df)} products")
         return df
-    except Exception as e:
-        print(f"JSON failed: {e}")
+    except FileNotFoundError:
+        say(f"Missing file: {filename}")
         return None
-#XLSX Region
-def get_excel_data(filename):
-    if not os.path.exists(filename):
-        print(f"No excel file found: {filename}")
+    except (ValueError, TypeError) as e:
+        say(f"JSON failed: {e}")
         return None
+#XLSX Region
+# calamine is the rust xlsx reader, openpyxl (the default) is pure python and slow
+def read_excel_fast(filename, usecols=None):
+    try:
+        return pd.read_excel(filename, usecols=usecols, engine="calamine")
+    except (ImportError, ValueError):
+        return pd.read_excel(filename, usecols=usecols)
+
+def get_excel_data(filename, usecols=None):
     try:
-        df = pd.read_excel(filename)
-        print(f"Excel loaded: {len(df)} regions")
+        df = read_cache(filename, usecols)
+        if df is None:
+            df = read_excel_fast(filename, usecols)
+            write_cache(filename, usecols, df)
+        say(f"Excel loaded: {len(df)} regions")
         return df
-    except:
-        print("Excel loading failed")
+    except FileNotFoundError:
+        say(f"No excel file found: {filename}")
         return None
+    except (ValueError, KeyError, OSError, zipfile.BadZipFile) as e:
+        say(f"Excel loading failed: {e}")
+        return None
+
+# Lookup table with its key as a sorted category list, built once before any sales rows get merged
+def with_key_categories(lookup, col):
+    return lookup.astype({col: pd.CategoricalDtype(sorted(lookup[col].dropna().unique()))})
+
+# Put the sales keys on the lookup's category list so pandas joins on the int codes
+# keys the lookup doesn't know go on the end, the caller's lookup table is never changed
+def align_keys(sales, lookup, col):
+    dtype = lookup[col].dtype
+    extra = pd.Index(sales[col].dropna().unique()).difference(dtype.categories)
+    if len(extra):
+        dtype = pd.CategoricalDtype(dtype.categories.append(extra))
+        lookup = lookup.astype({col: dtype})  # small copy just for this join
+    sales[col] = sales[col].astype(dtype)
+    return lookup.set_index(col)
+
+# Positions of the k biggest values, biggest first - same rows and order as nlargest(k)
+# ties keep the earlier row, NaN rows only fill in when there are fewer than k real values
+def top_k_positions(values, k):
+    valid = np.flatnonzero(~np.isnan(values))
+    k_valid = min(k, valid.size)
+    if k_valid:
+        vals = values[valid]
+        # argpartition only finds the k-th biggest value, rows tied with it are taken in row order
+        cutoff = np.partition(vals, -k_valid)[-k_valid]
+        above = valid[vals > cutoff]
+        tied = valid[vals == cutoff][:k_valid - above.size]
+        idx = np.sort(np.concatenate([above, tied]))
+        idx = idx[np.argsort(-values[idx], kind="stable")]
+    else:
+        idx = np.array([], dtype=np.intp)
+    missing = np.flatnonzero(np.isnan(values))[:k - k_valid]
+    return np.concatenate([idx, missing])
+
+# Revenue summed into a (regions x categories) grid using the category codes
+# bincount does the scatter-add in C, seen marks the pairs that actually had rows ( same as observed=True )
+def sum_by_codes(region_codes, category_codes, revenue, n_regions, n_categories):
+    ok = (region_codes >= 0) & (category_codes >= 0)  # -1 code means missing region/category
+    keys = region_codes[ok] * n_categories + category_codes[ok]
+    size = n_regions * n_categories
+    sums = np.bincount(keys, weights=np.nan_to_num(revenue[ok]), minlength=size)  # NaN counts as 0 like pandas sum
+    seen = np.bincount(keys, minlength=size) > 0
+    return sums.reshape(n_regions, n_categories), seen.reshape(n_regions, n_categories)
+
+# Sums for a sorted key array, one output per run of equal keys
+# the revenue gets read front to back so this stays fast even when the grid is huge
+def sum_sorted_runs(keys, revenue):
+    if keys.size == 0:
+        return keys, np.zeros(0)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return keys[starts], np.add.reduceat(np.nan_to_num(revenue), starts)
+
+# past this many region x category cells the dense grid falls out of cache, sort instead
+DENSE_GRID_LIMIT = 1 << 20
+
+# region_codes / revenue come in already pulled out of df so every aggregation shares them
+def revenue_by_region_category(df, region_codes, revenue):
+    regions = df['Region'].cat.categories
+    categories = df['Category'].cat.categories
+    category_codes = df['Category'].cat.codes.to_numpy(np.int32)
+    if len(regions) * len(categories) <= DENSE_GRID_LIMIT:
+        sums, seen = sum_by_codes(region_codes, category_codes, revenue, len(regions), len(categories))
+        r_idx, c_idx = np.nonzero(seen)
+        totals = sums[r_idx, c_idx]
+    else:
+        ok = (region_codes >= 0) & (category_codes >= 0)
+        keys = region_codes[ok].astype(np.int64) * len(categories) + category_codes[ok]
+        order = np.argsort(keys, kind="stable")
+        run_keys, totals = sum_sorted_runs(keys[order], revenue[ok][order])
+        r_idx, c_idx = np.divmod(run_keys, len(categories))
+    keys = pd.MultiIndex.from_arrays([regions[r_idx], categories[c_idx]], names=['Region', 'Category'])
+    return pd.Series(totals, index=keys, name='Revenue')
+
+def revenue_by_region(df, region_codes, revenue):
+    regions = df['Region'].cat.categories
+    ok = region_codes >= 0
+    sums = np.bincount(region_codes[ok], weights=np.nan_to_num(revenue[ok]), minlength=len(regions))
+    seen = np.bincount(region_codes[ok], minlength=len(regions)) > 0
+    return pd.Series(sums[seen], index=pd.Index(regions[seen], name='Region'), name='Revenue')
+
+# Joins the lookup tables onto some sales rows ( the whole file or one chunk of it )
+def merge_sales(sales, product_info, region_data):
+    products = align_keys(sales, product_info, 'Product')
+    regions = align_keys(sales, region_data, 'Region')
+    # both joins in one go, no step1 copy lying around
+    merged = sales.join(products, on='Product', how='left').join(regions, on='Region', how='left')
+    # category codes for the analysis passes, Revenue stays float64 so every amount keeps its cents
+    return merged.astype({'Revenue': 'float64', 'Region': 'category', 'Category': 'category', 'Product': 'category'})
+
+# All the numbers the report needs from one piece of merged data, they add up across chunks
+def analyze_chunk(df):
+    # pull the region codes and revenue out once, every number below reuses them
+    # float64 from here on so adding up many chunks doesn't lose cents
+    region_codes = df['Region'].cat.codes.to_numpy(np.int32)
+    revenue = df['Revenue'].to_numpy(np.float64)
+    has_revenue = ~np.isnan(revenue)
+    # one isna pass, only the columns that actually have gaps are kept
+    missing = df.isna().sum()
+    return {
+        'rows': len(df),
+        'missing': missing[missing > 0],
+        'by_region_category': revenue_by_region_category(df, region_codes, revenue),
+        'by_region': revenue_by_region(df, region_codes, revenue),
+        'total': float(revenue[has_revenue].sum()),
+        'count': int(has_revenue.sum()),
+        'top': df.iloc[top_k_positions(revenue, 5)][['Product', 'Region', 'Revenue']],
+    }
+
+def combine_parts(parts):
+    def add_up(key):
+        return reduce(lambda a, b: a.add(b, fill_value=0), (part[key] for part in parts))
+    top = pd.concat([part['top'] for part in parts], ignore_index=True)
+    top_rev = top['Revenue'].to_numpy(dtype='float64', na_value=np.nan)
+    return {
+        'rows': sum(part['rows'] for part in parts),
+        'missing': add_up('missing').astype('int64'),
+        'by_region_category': add_up('by_region_category'),
+        'by_region': add_up('by_region'),
+        'total': sum(part['total'] for part in parts),
+        'count': sum(part['count'] for part in parts),
+        'top': top.iloc[top_k_positions(top_rev, 5)],
+    }
+
+# sales files bigger than this get streamed in chunks instead of loaded whole
+STREAM_THRESHOLD_BYTES = 512 * 1024 * 1024
+STREAM_CHUNK_ROWS = 1_000_000
+
+def is_big_file(filename):
+    try:
+        return os.path.getsize(filename) > STREAM_THRESHOLD_BYTES
+    except OSError:
+        return False  # let the normal loader report the missing file
+
+def main():
+    print("Starting my data pipeline project...")
+    print("Checking for requirements to run the code...!")
+    # Data loading part
+    print("\n=== Loading Data ===")
+    stream_sales = is_big_file('sales_data.csv')
+    # three separate files, so load them at the same time ( the parsers let go of the GIL )
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        json_job = pool.submit(load_json_stuff, 'product_metadata.json')
+        excel_job = pool.submit(get_excel_data, 'region_info.xlsx')
+        if stream_sales:
+            print("sales_data.csv is big, it will be streamed in chunks")
+            sales_data = None
+        else:
+            sales_data = pool.submit(load_csv_file, 'sales_data.csv', usecols=SALES_COLUMNS).result()
+        product_info, region_data = json_job.result(), excel_job.result()
+
+    # check if everything loaded 
+    if (sales_data is None and not stream_sales) or product_info is None or region_data is None:
+        print("Some files didn't load properly :(")
+        return
+    # lookup tables have to be unique per key for the join
+    if not product_info['Product'].is_unique or not region_data['Region'].is_unique:
+        print("Duplicate products or regions in the lookup files :(")
+        return
+    # the key category lists are fixed here, every chunk below joins against the same ones
+    product_info = with_key_categories(product_info, 'Product')
+    region_data = with_key_categories(region_data, 'Region')
+
+    # Data merging area 
+    print("\n..........Combining Data..........")
+    print("Joining sales with product info and region data...")
+    if stream_sales:
+        # only one chunk is ever in memory, the partial sums get added up at the end
+        parts = []
+        try:
+            # C parser here, the pyarrow engine can't do chunksize
+            for chunk in pd.read_csv('sales_data.csv', usecols=SALES_COLUMNS, dtype=SALES_DTYPES, chunksize=STREAM_CHUNK_ROWS):
+                parts.append(analyze_chunk(merge_sales(chunk, product_info, region_data)))
+        except (pd.errors.ParserError, ValueError, KeyError) as e:
+            print(f"Something went wrong streaming sales_data.csv: {e}")
+            return
+        if not parts:
+            print("sales_data.csv has no rows :(")
+            return
+    else:
+        final_data = merge_sales(sales_data, product_info, region_data)
+        parts = [analyze_chunk(final_data)]
+    stats = combine_parts(parts)
+    print(f"Final dataset: {stats['rows']} records")
+
+    # check for any errors or missing statements after merging
+    if len(stats['missing']):
+        print("Warning: some data is missing after merging")
+        print(stats['missing'])
+
+    print("\n=== Analysis Time ===")
+    # group by region and category ( basic )
+    revenue_summary = stats['by_region_category'].sort_values(ascending=False)
+
+    print("Revenue by Region and Category:")
+    print("-" * 40)
+    # build all the lines straight off the Series, no DataFrame in between
+    print("\n".join(f"{region} - {category}: ${rev:,.2f}" for (region, category), rev in revenue_summary.items()))
+
+    # some extra analysis because why not
+    print("\n=== Extra Stats ===")
+    total_rev = stats['total']
+    avg_rev = total_rev / stats['count'] if stats['count'] else float('nan')
+    # one pass over Region, reused for both the name and the amount
+    region_rev = stats['by_region']
+    best_region = region_rev.idxmax()
+    best_region_rev = region_rev.max()
+
+    print(f"Total Revenue: ${total_rev:,.2f}")
+    print(f"Average Revenue: ${avg_rev:.2f}")
+    print(f"Best Region: {best_region} (${best_region_rev:,.2f})")
+    print(f"Total Records Processed: {stats['rows']}")
+
+    # show top 5 individual sales
+    print("\nTop 5 Individual Sales:")
+    top_sales = stats['top']
+    top_lines = zip(top_sales['Product'].to_numpy(), top_sales['Region'].to_numpy(), top_sales['Revenue'].to_numpy())
+    print("\n".join(f"  {p} in {r}: ${v:,.2f}" for p, r, v in top_lines))
+
+    print("\nDone! Pipeline finished successfully.")
+    print("This was actually easier than I thought it would be")
 
-# Data loading part
-print("\n=== Loading Data ===")
-sales_data = load_csv_file('sales_data.csv')
-product_info = load_json_stuff('product_metadata.json')
-region_data = get_excel_data('region_info.xlsx')
-
-# check if everything loaded 
-if sales_data is None or product_info is None or region_data is None:
-    print("Some files didn't load properly :(")
-    exit()
-
-# Data merging area 
-print("\n..........Combining Data..........")
-# merge step 1
-print("Merging sales with product info...")
-step1 = pd.merge(sales_data, product_info, on='Product', how='left')
-print(f"After merge 1: {len(step1)} records")
-# merge step 2  
-print("Adding region data...")
-final_data = pd.merge(step1, region_data, on='Region', how='left')
-print(f"Final dataset: {len(final_data)} records")
-
-# check for any errors or missing statements after merging
-missing = final_data.isnull().sum()
-if missing.any():
-    print("Warning: some data is missing after merging")
-    print(missing[missing > 0])
-
-print("\n=== Analysis Time ===")
-# group by region and category ( basic )
-revenue_summary = final_data.groupby(['Region', 'Category'])['Revenue'].sum().reset_index()
-revenue_summary = revenue_summary.sort_values('Revenue', ascending=False)
-
-print("Revenue by Region and Category:")
-print("-" * 40)
-for i, row in revenue_summary.iterrows():
-    print(f"{row['Region']} - {row['Category']}: ${row['Revenue']:,.2f}")
-
-# some extra analysis because why not
-print("\n=== Extra Stats ===")
-total_rev = final_data['Revenue'].sum()
-avg_rev = final_data['Revenue'].mean()
-best_region = final_data.groupby('Region')['Revenue'].sum().idxmax()
-best_region_rev = final_data.groupby('Region')['Revenue'].sum().max()
-
-print(f"Total Revenue: ${total_rev:,.2f}")
-print(f"Average Revenue: ${avg_rev:.2f}")
-print(f"Best Region: {best_region} (${best_region_rev:,.2f})")
-print(f"Total Records Processed: {len(final_data)}")
-
-# show top 5 individual sales
-print("\nTop 5 Individual Sales:")
-top_sales = final_data.nlargest(5, 'Revenue')[['Product', 'Region', 'Revenue']]
-for i, row in top_sales.iterrows():
-    print(f"  {row['Product']} in {row['Region']}: ${row['Revenue']:,.2f}")
-
-print("\nDone! Pipeline finished successfully.")
-print("This was actually easier than I thought it would be")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -22,21 +22,104 @@ Required Libraries: pandas, numpy, matplotlib, seaborn, tabulate, openpyxl, json
 import pandas as pd
 import numpy as np
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-from tabulate import tabulate
+import math
 from datetime import datetime,timedelta
 import warnings
 import os
+import re
 from pathlib import Path
 import time # For using this a single time in whole code ( worth the sacrifice )
+try:
+    import pyarrow # Optional - lets pandas parse CSV files on all cores and write Parquet
+    HAVE_PYARROW = True
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    HAVE_PYARROW = False
+    CSV_ENGINE = 'c'
+try:
+    import orjson # Optional - parses JSON a lot faster than the json module, falls back to json if missing
+except ImportError:
+    orjson = None
+try:
+    import ijson # Optional - streams records out of huge JSON files instead of loading the whole tree
+    JSON_STREAM_ERRORS = (ijson.JSONError,)
+except ImportError:
+    ijson = None
+    JSON_STREAM_ERRORS = ()
 
 # Configure display settings for the device ( not Iphone though.. i hate it )
 warnings.filterwarnings('ignore')
 pd.set_option('display.max_columns', None)
 pd.set_option('display.width', None)
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+
+# Column name patterns used to auto-detect date and numeric columns
+DATE_COLUMN_RE = re.compile(r"date|time|created|updated", re.IGNORECASE)
+NUMERIC_COLUMN_RE = re.compile(r"price|cost|revenue|amount|quantity|units|sales", re.IGNORECASE)
+REVENUE_COLUMN_PATTERN = r"revenue|sales|amount|price|cost|total"
+
+def read_json_file(path):
+    """Parse a JSON file with orjson when available, else the standard json module"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _finite_or_none(value):
+    """NaN / inf become None ( null ) - orjson does this itself, the json module would write invalid NaN tokens"""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(item) for item in value]
+    return value
+
+def _json_default(obj):
+    """Convert what the JSON encoders can't handle on their own ( Series, numpy scalars, Timestamps )"""
+    if isinstance(obj, pd.Series):
+        return dict(zip(obj.index.astype(str), _finite_or_none(obj.tolist())))
+    if isinstance(obj, np.generic):
+        return _finite_or_none(obj.item())
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj).__name__} is not JSON serializable")
+
+def to_json_text(data):
+    """Indented JSON text for the insights report, orjson when available else the json module
+       Both write NaN as null and non-ASCII names as plain UTF-8, number formatting can still differ ( 1e20 vs 1e+20 )
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(_finite_or_none(data), default=_json_default, indent=2, allow_nan=False, ensure_ascii=False)
+
+# JSON lists bigger than this are streamed record by record ( needs ijson )
+JSON_STREAM_THRESHOLD_BYTES = 256 * 1024 * 1024
+JSON_STREAM_BATCH_SIZE = 100_000
+
+# Rows looked at before deciding a text column has too many unique values to analyze
+LOW_CARDINALITY_SAMPLE_ROWS = 10_000
+
+def json_is_top_level_list(path):
+    """Peek at the first non-blank byte to see if the file is one big JSON array"""
+    with open(path, 'rb') as f:
+        return f.read(4096).lstrip()[:1] == b'['
+
+def stream_json_records(path, batch_size=JSON_STREAM_BATCH_SIZE):
+    """Build a DataFrame from a JSON array in batches, only one batch of records is held as Python objects"""
+    frames = []
+    batch = []
+    with open(path, 'rb') as f:
+        for record in ijson.items(f, 'item', use_float=True):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                frames.append(pd.DataFrame.from_records(batch))
+                batch = []
+    if batch or not frames:
+        frames.append(pd.DataFrame.from_records(batch))
+    return pd.concat(frames, ignore_index=True)
 
 # Here starts the root of the tree or Basin to the pipes about to be pulled
 class RobustSalesDataPipeline:
@@ -53,7 +136,10 @@ class RobustSalesDataPipeline:
         self.metadata = None
         self.region_data = None
         self.merged_data = None
+        self.excel_sheets = None
         self.insights = {}
+        self._cache_owner = None
+        self._cache = {}
         
     def inspect_data_files(self):
         """Inspect your data files to understand their structure"""
@@ -78,8 +164,7 @@ class RobustSalesDataPipeline:
             print(f"\nJSON File: {self.json_file}")
             print("-" * 30)
             try:
-                with open(self.json_file, 'r') as f:
-                    data = json.load(f)
+                data = read_json_file(self.json_file)
                 if isinstance(data, list) and len(data) > 0:
                     print("Type: List of objects")
                     print("Number of records:", len(data))
@@ -99,10 +184,10 @@ class RobustSalesDataPipeline:
             print("-" * 30)
             try:
                 # Check available sheets
-                excel_file = pd.ExcelFile(self.excel_file)
-                print("Available sheets:", excel_file.sheet_names)
-                # Read first sheet sample
-                df_sample = pd.read_excel(self.excel_file, nrows=5)
+                with self.open_excel_workbook() as excel_file:
+                    print("Available sheets:", excel_file.sheet_names)
+                    # Read first sheet sample
+                    df_sample = excel_file.parse(0, nrows=5)
                 print("Columns:", list(df_sample.columns))
                 print("Shape:", df_sample.shape)
                 print("Sample data:")
@@ -112,6 +197,26 @@ class RobustSalesDataPipeline:
             except (FileNotFoundError, ValueError, OSError) as e:
                 print(f"Error reading the Excel file - Reason: {e}")
         print("Data Inspection completed !!!")
+
+    def inspect_loaded_data(self):
+        """Inspect the already loaded data, same summary as inspect_data_files without reading the files again"""
+        print("\nINSPECTING YOUR DATA FILES")
+        print("=" * 50)
+        loaded = [('CSV', self.csv_file, self.sales_data), ('JSON', self.json_file, self.metadata), ('Excel', self.excel_file, self.region_data)]
+        for label, path, data in loaded:
+            if data is None:
+                continue
+            print(f"\n{label} File: {path}")
+            print("-" * 30)
+            if label == 'Excel' and self.excel_sheets:
+                print("Available sheets:", self.excel_sheets)
+            print("Columns:", list(data.columns))
+            print("Shape:", data.shape)
+            print("Sample data:")
+            print(data.head())
+            print("\nData types:")
+            print(data.dtypes)
+        print("Data Inspection completed !!!")
     # Loading the CSV data into Pipeline
     def load_csv_file_data(self, date_columns=None, numeric_columns=None):
         """Load and validate CSV data with flexible column detection
@@ -122,36 +227,43 @@ class RobustSalesDataPipeline:
             return None
         try:
             print(f"Loading CSV data from {self.csv_file}...")
-            data = pd.read_csv(self.csv_file)
-            print(f"Loaded {len(data)} records with {len(data.columns)} columns")
-            # Auto-detect date columns if not specified
+            # Read just the header first so the column types are known before the full read
+            columns = pd.read_csv(self.csv_file, nrows=0).columns
+            # Auto-detect date and numeric columns if not specified ( one regex match over all the names )
             if date_columns is None:
-                date_columns = []
-                for col in data.columns:
-                    if any(keyword in col.lower() for keyword in ['date', 'time', 'created', 'updated']):
-                        date_columns.append(col)
-            # Convert date columns
-            for col in date_columns:
-                if col in data.columns:
-                    try:
-                        data[col] = pd.to_datetime(data[col])
-                        print(f"Converted {col} to datetime")
-                    except:
-                        print(f"Could not convert {col} to datetime")
-            # Auto-detect numeric columns if not specified
+                date_columns = columns[columns.str.contains(DATE_COLUMN_RE)].tolist()
+            date_columns = [col for col in date_columns if col in columns]
             if numeric_columns is None:
-                numeric_columns = []
-                for col in data.columns:
-                    if any(keyword in col.lower() for keyword in ['price', 'cost', 'revenue', 'amount', 'quantity', 'units', 'sales']):
-                        numeric_columns.append(col)
-            # Convert numeric columns
+                numeric_columns = columns[columns.str.contains(NUMERIC_COLUMN_RE)].tolist()
+            # Dates are parsed by read_csv itself, numbers are typed by the parser already
+            data = pd.read_csv(self.csv_file, parse_dates=date_columns, engine=CSV_ENGINE)
+            print(f"Loaded {len(data)} records with {len(data.columns)} columns")
+            # Only columns the parser couldn't type still need converting
+            for col in date_columns:
+                if pd.api.types.is_datetime64_any_dtype(data[col]):
+                    print(f"Converted {col} to datetime")
+                    continue
+                try:
+                    data[col] = pd.to_datetime(data[col])
+                    print(f"Converted {col} to datetime")
+                except:
+                    print(f"Could not convert {col} to datetime")
             for col in numeric_columns:
                 if col in data.columns:
+                    if pd.api.types.is_numeric_dtype(data[col]):
+                        print(f"Converted {col} to numeric")
+                        continue
                     try:
                         data[col] = pd.to_numeric(data[col], errors='coerce')
                         print(f"Converted {col} to numeric")
                     except:
                         print(f"Could not convert {col} to numeric")
+            # Shrink the data - smallest integer type that fits, repeated text stored as category
+            for col in data.select_dtypes(include=['integer']).columns:
+                data[col] = pd.to_numeric(data[col], downcast='integer')
+            for col in data.select_dtypes(include=['object']).columns:
+                if data[col].nunique() < 0.5 * len(data):
+                    data[col] = data[col].astype('category')
             # Remove rows with all NaN values
             data = data.dropna(how='all')
             print(f"Cleaned data: {len(data)} records")
@@ -167,8 +279,12 @@ class RobustSalesDataPipeline:
             return None
         try:
             print(f"Loading JSON data from {self.json_file}...")
-            with open(self.json_file, 'r') as f:
-                data = json.load(f)
+            # Huge JSON arrays get streamed, everything else is parsed in one go
+            if ijson is not None and os.path.getsize(self.json_file) > JSON_STREAM_THRESHOLD_BYTES and json_is_top_level_list(self.json_file):
+                sales_Metadata = stream_json_records(self.json_file)
+                print(f"Loaded {len(sales_Metadata)} records from JSON")
+                return sales_Metadata
+            data = read_json_file(self.json_file)
             # Handle different JSON structures
             if isinstance(data, list):
                 sales_Metadata = pd.DataFrame(data)
@@ -188,7 +304,7 @@ class RobustSalesDataPipeline:
                 return None 
             print(f"Loaded {len(sales_Metadata)} records from JSON")
             return sales_Metadata 
-        except (FileNotFoundError, json.JSONDecodeError, TypeError, OSError) as e:
+        except (FileNotFoundError, json.JSONDecodeError, TypeError, OSError) + JSON_STREAM_ERRORS as e:
             print(f" JSON Loading has been Failed - Probable cause: {e}")
             return None
     # Loading the Excel into Pipeline
@@ -199,8 +315,10 @@ class RobustSalesDataPipeline:
             return None
         try:
             print(f"Loading Excel data from {self.excel_file}...")  
-            # Read the specified sheet
-            data = pd.read_excel(self.excel_file, sheet_name=sheet_name)  
+            # Open the workbook once for both the sheet list and the sheet itself
+            with self.open_excel_workbook() as excel:
+                self.excel_sheets = excel.sheet_names
+                data = excel.parse(sheet_name)
             # Clean column names (remove spaces, special characters)
             data.columns = data.columns.str.strip() 
             print(f"Loaded {len(data)} records from Excel")
@@ -208,16 +326,24 @@ class RobustSalesDataPipeline:
         except (FileNotFoundError, ValueError, OSError) as e:
             print(f"Excel Loading has been Failed - Probable cause: {e}")
             return None
+    def open_excel_workbook(self):
+        """Open the Excel file with calamine ( rust reader, much faster ), falls back to openpyxl if it is missing"""
+        try:
+            return pd.ExcelFile(self.excel_file, engine='calamine')
+        except (ImportError, ValueError):  # python-calamine not installed or pandas older than 2.2
+            return pd.ExcelFile(self.excel_file)
     # Data Merging process of Multiple formats ( if existed )
     def sales_merge_data(self, merge_keys=None):
-        """Merge the loaded data sources based on common columns"""
+        """Merge the loaded data sources based on common columns
+           Note: sales_data is not copied - with nothing to join, merged_data is the same frame, so don't edit sales_data in place afterwards
+        """
         print("\n" + "="*50)
         print("SALES DATA MERGING BEGINS...")
         print("="*50)
         if self.sales_data is None:
             print("No primary data available for merging")
             return None
-        merged = self.sales_data.copy()
+        merged = self.sales_data  # join() returns a new frame anyway, no need for a full copy up front
         print(f"Starting with primary data: {len(merged)} records")
         # Sales merge with metadata
         if self.metadata is not None:
@@ -234,7 +360,8 @@ class RobustSalesDataPipeline:
             else:
                 merge_key = merge_keys.get('metadata')
             if merge_key and merge_key in merged.columns and merge_key in self.metadata.columns:
-                merged = pd.merge(merged, self.metadata, on=merge_key, how='left', suffixes=('', '_meta'))
+                # Index join - the lookup side is hashed once through its index instead of a fresh merge table
+                merged = merged.join(self.metadata.set_index(merge_key), on=merge_key, how='left', rsuffix='_meta')
                 print(f"Merged with metadata: {len(merged)} records")
             else:
                 print("Skipping metadata merge - no suitable key found to merge")
@@ -252,7 +379,7 @@ class RobustSalesDataPipeline:
             else:
                 merge_key = merge_keys.get('region')
             if merge_key and merge_key in merged.columns and merge_key in self.region_data.columns:
-                merged = pd.merge(merged, self.region_data, on=merge_key, how='left', suffixes=('', '_region'))
+                merged = merged.join(self.region_data.set_index(merge_key), on=merge_key, how='left', rsuffix='_region')
                 print(f"Merged with additional data: {len(merged)} records")
             else:
                 print("Skipping additional data merge - no suitable key found") 
@@ -263,6 +390,55 @@ class RobustSalesDataPipeline:
         print(merged.head())
         print("Data Merging Process is Successfully implemented")
         return merged
+    def _merged_cache(self):
+        """Results worked out from merged_data, thrown away as soon as merged_data is replaced"""
+        if self._cache_owner is not self.merged_data:
+            self._cache_owner = self.merged_data
+            self._cache = {}
+        return self._cache
+
+    def merged_column_types(self):
+        """Numeric, text and date column lists of the merged data - worked out once, reused by insights and visualizations"""
+        cache = self._merged_cache()
+        if 'column_types' not in cache:
+            numeric_cols = self.merged_data.select_dtypes(include=[np.number]).columns.tolist()
+            text_cols = self.merged_data.select_dtypes(include=['object', 'category']).columns.tolist()
+            date_cols = self.merged_data.select_dtypes(include=['datetime']).columns.tolist()
+            cache['column_types'] = (numeric_cols, text_cols, date_cols)
+        return cache['column_types']
+
+    def merged_value_counts(self, col):
+        """value_counts of one merged column - counted once, len() of it is the number of unique values"""
+        cache = self._merged_cache()
+        if ('value_counts', col) not in cache:
+            value_counts = self.merged_data[col].value_counts()
+            cache[('value_counts', col)] = value_counts[value_counts > 0]  # category columns also list unused categories
+        return cache[('value_counts', col)]
+
+    def merged_is_low_cardinality(self, col, limit, sample_rows=LOW_CARDINALITY_SAMPLE_ROWS):
+        """True when col has fewer than limit unique values
+           The first sample_rows rows are checked first, a busy column ( free text, IDs ) is rejected without counting all of it
+        """
+        if self.merged_data[col].head(sample_rows).nunique() >= limit:
+            return False
+        return len(self.merged_value_counts(col)) < limit
+
+    def merged_revenue_columns(self):
+        """Numeric columns of the merged data that look like money ( revenue, sales, price ... )"""
+        cache = self._merged_cache()
+        if 'revenue_columns' not in cache:
+            numeric_cols = pd.Index(self.merged_column_types()[0])
+            # Lower-case every name once and match them all in one vectorized scan
+            is_revenue = numeric_cols.astype(str).str.lower().str.contains(REVENUE_COLUMN_PATTERN, regex=True)
+            cache['revenue_columns'] = numeric_cols[is_revenue].tolist()
+        return cache['revenue_columns']
+
+    def merged_daily_sum(self, date_col, value_col):
+        """Daily sum of value_col - grouped once, shared by the time analysis and the time series plot"""
+        cache = self._merged_cache()
+        if ('daily_sum', date_col, value_col) not in cache:
+            cache[('daily_sum', date_col, value_col)] = self.merged_data.groupby(pd.Grouper(key=date_col, freq='D'))[value_col].sum()
+        return cache[('daily_sum', date_col, value_col)]
     # Insights generation based on Sales data ( Well , mostly this area doesn't disturb but if it does - You GOT a problem )
     def generate_sales_data_insights(self):
         """Generate insights based on available data"""
@@ -274,43 +450,36 @@ class RobustSalesDataPipeline:
         print("="*50)
         sales_Metadata = self.merged_data
         insights = {}
+        # Find numeric columns for analysis ( this region is like a colour festival in vscode )
+        numeric_cols, text_cols, date_cols = self.merged_column_types()
         # Basic statistics
         print("Analyzing data structure...")
         insights['basic_stats'] = {
             'total_records': len(sales_Metadata),
             'total_columns': len(sales_Metadata.columns),
-            'numeric_columns': len(sales_Metadata.select_dtypes(include=[np.number]).columns),
-            'text_columns': len(sales_Metadata.select_dtypes(include=['object']).columns),
-            'date_columns': len(sales_Metadata.select_dtypes(include=['datetime']).columns)
+            'numeric_columns': len(numeric_cols),
+            'text_columns': len(text_cols),
+            'date_columns': len(date_cols)
         }
-        # Find numeric columns for analysis ( this region is like a colour festival in vscode )
-        numeric_cols = sales_Metadata.select_dtypes(include=[np.number]).columns.tolist()
-        text_cols = sales_Metadata.select_dtypes(include=['object']).columns.tolist()
-        date_cols = sales_Metadata.select_dtypes(include=['datetime']).columns.tolist()
         print(f"Found {len(numeric_cols)} numeric columns: {numeric_cols}")
         print(f"Found {len(text_cols)} text columns: {text_cols}")
         print(f"Found {len(date_cols)} date columns: {date_cols}")
         # Revenue/Sales analysis ( look for money-related columns )
-        revenue_cols = [col for col in numeric_cols if any(keyword in col.lower() for keyword in ['revenue', 'sales', 'amount', 'price', 'cost', 'total'])]
+        revenue_cols = self.merged_revenue_columns()
         if revenue_cols:
-            insights['financial_summary'] = {}
-            for col in revenue_cols:
-                insights['financial_summary'][col] = {
-                    'total': sales_Metadata[col].sum(),
-                    'average': sales_Metadata[col].mean(),
-                    'median': sales_Metadata[col].median(),
-                    'min': sales_Metadata[col].min(),
-                    'max': sales_Metadata[col].max()
-                }
+            # All five stats for every money column from a single agg call
+            financial_stats = sales_Metadata[revenue_cols].agg(['sum', 'mean', 'median', 'min', 'max'])
+            financial_stats.index = ['total', 'average', 'median', 'min', 'max']
+            insights['financial_summary'] = financial_stats.to_dict()
         # Categorical analysis
         categorical_insights = {}
         for col in text_cols:
-            if sales_Metadata[col].nunique() < 20:  # Only analyze columns with reasonable number of categories
-                value_counts = sales_Metadata[col].value_counts()
+            if self.merged_is_low_cardinality(col, 20):  # Only analyze columns with reasonable number of categories
+                value_counts = self.merged_value_counts(col)
                 categorical_insights[col] = {
-                    'unique_values': sales_Metadata[col].nunique(),
-                    'top_values': value_counts.head().to_dict(),
-                    'distribution': value_counts.to_dict()
+                    'unique_values': len(value_counts),
+                    'top_values': value_counts.head(),  # kept as Series, only turned into JSON when exported
+                    'distribution': value_counts
                 }
         if categorical_insights:
             insights['categorical_analysis'] = categorical_insights
@@ -319,26 +488,24 @@ class RobustSalesDataPipeline:
             insights['time_analysis'] = {}
             for date_col in date_cols[:1]:  # Analyze first date column
                 for rev_col in revenue_cols[:1]:  # Analyze first revenue column
-                    df_time = sales_Metadata.groupby(pd.Grouper(key=date_col, freq='D'))[rev_col].sum().reset_index()
+                    daily = self.merged_daily_sum(date_col, rev_col)  # Series indexed by day, idxmax/idxmin give the date straight away
                     insights['time_analysis'][f'{rev_col}_by_{date_col}'] = {
-                        'daily_average': df_time[rev_col].mean(),
-                        'best_day': df_time.loc[df_time[rev_col].idxmax(), date_col] if len(df_time) > 0 else None,
-                        'worst_day': df_time.loc[df_time[rev_col].idxmin(), date_col] if len(df_time) > 0 else None
+                        'daily_average': daily.mean(),
+                        'best_day': daily.idxmax() if len(daily) > 0 else None,
+                        'worst_day': daily.idxmin() if len(daily) > 0 else None
                     }
         # Correlation analysis
         if len(numeric_cols) > 1:
             correlation_matrix = sales_Metadata[numeric_cols].corr()
-            # Find strong correlations (> 0.7 or < -0.7)
-            strong_correlations = []
-            for i in range(len(correlation_matrix.columns)):
-                for j in range(i+1, len(correlation_matrix.columns)):
-                    corr_value = correlation_matrix.iloc[i, j]
-                    if abs(corr_value) > 0.7:
-                        strong_correlations.append({
-                            'col1': correlation_matrix.columns[i],
-                            'col2': correlation_matrix.columns[j],
-                            'correlation': corr_value
-                        })
+            # Find strong correlations (> 0.7 or < -0.7) - every pair above the diagonal checked in one go
+            corr_values = correlation_matrix.to_numpy()
+            corr_names = correlation_matrix.columns
+            rows, cols = np.triu_indices(len(corr_names), k=1)
+            strong = np.abs(corr_values[rows, cols]) > 0.7
+            strong_correlations = [
+                {'col1': corr_names[i], 'col2': corr_names[j], 'correlation': corr_values[i, j]}
+                for i, j in zip(rows[strong], cols[strong])
+            ]
             if strong_correlations:
                 insights['correlations'] = strong_correlations
         self.insights = insights
@@ -401,15 +568,17 @@ class RobustSalesDataPipeline:
         print("GENERATING SALES DATA VISUALIZATIONS")
         print("="*50)
         sales_Metadata = self.merged_data
-        numeric_cols = sales_Metadata.select_dtypes(include=[np.number]).columns.tolist()
-        text_cols = sales_Metadata.select_dtypes(include=['object']).columns.tolist()
-        date_cols = sales_Metadata.select_dtypes(include=['datetime']).columns.tolist()
+        numeric_cols, text_cols, date_cols = self.merged_column_types()
         # Calculate number of subplots needed 
         n_plots = min(6, len(numeric_cols) + len(text_cols))
         if n_plots == 0:
             print("No suitable columns found for visualization")
             return
-        # Set up the plotting environment
+        # Set up the plotting environment ( imported here so loading/insights alone don't pay for matplotlib )
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
         fig = plt.figure(figsize=(15, 10))
         plot_count = 0
         # Plot numeric columns (histograms)
@@ -418,7 +587,9 @@ class RobustSalesDataPipeline:
                 break
             plot_count += 1
             plt.subplot(2, 3, plot_count)
-            plt.hist(sales_Metadata[col].dropna(), bins=20, alpha=0.7, color='skyblue')
+            # Bin with numpy up front, matplotlib only has to draw the bars
+            counts, edges = np.histogram(sales_Metadata[col].dropna().to_numpy(), bins=20)
+            plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, color='skyblue')
             plt.title(f'Distribution of {col}', fontsize=12, fontweight='bold')
             plt.xlabel(col)
             plt.ylabel('Frequency')
@@ -426,10 +597,10 @@ class RobustSalesDataPipeline:
         for i, col in enumerate(text_cols[:3]):
             if plot_count >= 6:
                 break
-            if sales_Metadata[col].nunique() <= 10:  # Only plot if reasonable number of categories
+            if self.merged_is_low_cardinality(col, 11):  # Only plot if reasonable number of categories ( 10 or fewer )
+                value_counts = self.merged_value_counts(col)
                 plot_count += 1
                 plt.subplot(2, 3, plot_count)
-                value_counts = sales_Metadata[col].value_counts().head(10)
                 plt.bar(range(len(value_counts)), value_counts.values, color='lightcoral')
                 plt.title(f'Top Values in {col}', fontsize=12, fontweight='bold')
                 plt.ylabel('Count')
@@ -439,9 +610,10 @@ class RobustSalesDataPipeline:
             plot_count += 1
             plt.subplot(2, 3, plot_count)
             date_col = date_cols[0]
-            num_col = numeric_cols[0]
-            # Group visualization data by date and sum
-            time_data = sales_Metadata.groupby(pd.Grouper(key=date_col, freq='D'))[num_col].sum()
+            revenue_cols = self.merged_revenue_columns()
+            num_col = revenue_cols[0] if revenue_cols else numeric_cols[0]
+            # Same daily sums the time analysis used ( only grouped once )
+            time_data = self.merged_daily_sum(date_col, num_col)
             plt.plot(time_data.index, time_data.values, marker='o', linewidth=2)
             plt.title(f'{num_col} Over Time', fontsize=12, fontweight='bold')
             plt.xlabel('Date')
@@ -459,12 +631,12 @@ class RobustSalesDataPipeline:
         plt.show() # Make sure this plt.show() is working , This here could Ragebait you to your limits 
         print("Visualizations created and saved as 'auto_insights_dashboard.png'")
     
-    def run_custom_pipeline(self): # This def function really played  with me
-        """Run the complete data pipeline with your files"""
+    def run_custom_pipeline(self, verbose=True): # This def function really played  with me
+        """Run the complete data pipeline with your files
+           verbose=False skips the data inspection printout
+        """
         print("STARTING CUSTOM DATA PIPELINE")
         print("=" * 60)
-        # Inspect your files first
-        self.inspect_data_files()
         # Load data from your files
         print("\nLOADING YOUR DATA FILES")
         print("-" * 35)
@@ -474,6 +646,9 @@ class RobustSalesDataPipeline:
             self.metadata = self.load_json_file_data()
         if self.excel_file:
             self.region_data = self.load_excel_file_data()
+        # Inspect what got loaded ( from memory, the files are not read a second time )
+        if verbose:
+            self.inspect_loaded_data()
         # Check if at least one file was loaded
         if all(data is None for data in [self.sales_data, self.metadata, self.region_data]):
             print("No data was successfully loaded. Please check your file paths and formats.")
@@ -512,34 +687,60 @@ class RobustSalesDataPipeline:
         else:
             print("Skipping Visualization !!! Returning to Terminal")
         # Export the Finished results 
-        self.export_custom_results()
+        data_files = self.export_custom_results()
         print("\n" + "="*60)
         print("CUSTOM PIPELINE COMPLETED SUCCESSFULLY!")
         print("="*60)
         print("\nFiles generated:")
         print("- auto_insights_dashboard.png (Visualizations)")
-        print("- custom_merged_data.csv (Processed data)")
+        for data_file in data_files:
+            print(f"- {data_file} (Processed data)")
         print("- custom_insights_report.txt (Text insights)")
     
-    def export_custom_results(self): # The only Def function that didn't slap my face with errors
-        """Export results from your custom data"""
+    def export_custom_results(self, export_csv=False): # The only Def function that didn't slap my face with errors
+        """Export results from your custom data
+           Merged data goes to Parquet (columnar + zstd), export_csv=True also writes a readable CSV copy
+           Returns the merged data files that were actually written
+        """
         print("\nEXPORTING CUSTOM RESULTS")
         print("-" * 30)
+        data_files = []
         # Export merged data if available
         if self.merged_data is not None:
-            self.merged_data.to_csv('custom_merged_data.csv', index=False)
-            print("Merged data exported to 'custom_merged_data.csv'")
+            # integers were shrunk to int8/int16 in memory only, the export gets int64 back so nobody downstream overflows
+            export_data = self.merged_data
+            narrow_ints = export_data.select_dtypes(include=['int8', 'int16', 'int32']).columns
+            if len(narrow_ints):
+                export_data = export_data.astype(dict.fromkeys(narrow_ints, 'int64'))
+            if HAVE_PYARROW:
+                try:
+                    export_data.to_parquet('custom_merged_data.parquet', engine='pyarrow', compression='zstd', index=False)
+                    print("Merged data exported to 'custom_merged_data.parquet'")
+                    data_files.append('custom_merged_data.parquet')
+                except (pyarrow.ArrowException, ValueError, TypeError) as e:  # ArrowNotImplementedError is a NotImplementedError, not a ValueError
+                    print(f"Parquet export has been Failed - Probable cause: {e}. Writing CSV instead")
+                    if os.path.exists('custom_merged_data.parquet'):
+                        os.remove('custom_merged_data.parquet')  # don't leave a half written file behind
+                    export_csv = True
+            else:
+                print("pyarrow is not installed - Writing CSV instead of Parquet")
+                export_csv = True
+            if export_csv:
+                export_data.to_csv('custom_merged_data.csv', index=False)
+                print("Merged data exported to 'custom_merged_data.csv'")
+                data_files.append('custom_merged_data.csv')
         # Export insights to text file
         if self.insights:
-            with open('custom_insights_report.txt', 'w') as f:
+            with open('custom_insights_report.txt', 'w', encoding='utf-8') as f:  # utf-8 so names like São Paulo also write on Windows
                 f.write("CUSTOM DATA INSIGHTS REPORT\n")
                 f.write("=" * 50 + "\n\n")
                 for section, data in self.insights.items():
                     f.write(f"{section.upper().replace('_', ' ')}\n")
                     f.write("-" * 30 + "\n")
-                    f.write(str(data))
+                    f.write(to_json_text(data))
                     f.write("\n\n")
             print("Insights exported to 'custom_insights_report.txt'")
+        return data_files
 
 # Example usage with your own Sample or Heavy-Data files
 if __name__ == "__main__":